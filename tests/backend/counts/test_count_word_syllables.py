@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import pytest
+from textstat.backend import counts, selections
+from .. import resources
+
+
+@pytest.mark.parametrize(
+    "text,lang,expected",
+    [
+        (resources.EMPTY_STR, "en_US", []),
+        (resources.SHORT_TEXT, "en_US", [1, 1, 1, 1, 3]),
+        ("They're here, and they're there.", "en_US", [1, 1, 1, 1, 1]),
+        (resources.EASY_SPANISH_TEXT, "es_ES", [1, 1, 1, 2, 1]),
+    ],
+)
+def test_count_word_syllables(text: str, lang: str, expected: list[int]) -> None:
+    assert counts.count_word_syllables(text, lang) == expected
+
+
+@pytest.mark.parametrize(
+    "text,lang",
+    [
+        (resources.LONG_TEXT, "en_US"),
+        (resources.LONG_SPANISH_TEXT, "es_ES"),
+    ],
+)
+def test_count_word_syllables_per_word(text: str, lang: str) -> None:
+    assert counts.count_word_syllables(text, lang) == [
+        counts.count_syllables(word, lang) for word in selections.list_words(text)
+    ]
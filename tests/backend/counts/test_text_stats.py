@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import pytest
+from textstat.backend import counts
+from .. import resources
+
+
+@pytest.mark.parametrize(
+    "text,lang,expected",
+    [
+        (resources.EASY_TEXT, "en_US", (431, 418, 99, 11, 139, 6, 65)),
+        (resources.SHORT_TEXT, "en_US", (25, 24, 5, 1, 7, 1, 4)),
+        (resources.PUNCT_TEXT, "en_US", (247, 227, 53, 5, 72, 4, 41)),
+        (resources.EMPTY_STR, "en_US", (0, 0, 0, 0, 0, 0, 0)),
+        (resources.GERMAN_SAMPLE_A, "de_DE", (76, 73, 14, 1, 22, 0, 6)),
+    ],
+)
+def test_text_stats(text: str, lang: str, expected: tuple[int, ...]) -> None:
+    assert counts.text_stats(text, lang) == counts.TextStats(*expected)
+
+
+@pytest.mark.parametrize(
+    "text,lang",
+    [
+        (resources.LONG_TEXT, "en_US"),
+        (resources.LONG_SPANISH_TEXT, "es_ES"),
+        (resources.HARD_HUNGARIAN_TEXT, "hu_HU"),
+    ],
+)
+def test_text_stats_matches_counts(text: str, lang: str) -> None:
+    stats = counts.text_stats(text, lang)
+    assert stats.n_chars == counts.count_chars(text, ignore_spaces=True)
+    assert stats.n_letters == counts.count_letters(text)
+    assert stats.n_words == counts.count_words(text)
+    assert stats.n_sentences == counts.count_sentences(text)
+    assert stats.n_syllables == counts.count_syllables(text, lang)
@@ -10,6 +10,9 @@ from .. import resources
     "text, lang, expected",
     [
         (resources.EMPTY_STR, "en_US", 0.0),
+        (" \n\t", "en_US", 0.0),
+        (resources.EMPTY_STR, "es_ES", 0.0),
+        (resources.VERY_EASY_TEXT, "en_US", 5.0),
         (resources.EASY_TEXT, "en_US", 4.0),
         (resources.SHORT_TEXT, "en_US", 2.0),
         (resources.PUNCT_TEXT, "en_US", 6.0),
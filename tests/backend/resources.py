@@ -71,6 +71,10 @@ LONG_TEXT = (
     "lives"
 )
 
+VERY_EASY_TEXT = (
+    "We go to school. It is a sunny day. Mom made a cake. The cat sat on the mat."
+)
+
 EASY_TEXT = (
     "Anna and her family love doing puzzles. Anna is best at "
     "little puzzles. Anna and her brother work on medium size "
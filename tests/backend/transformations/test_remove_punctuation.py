@@ -19,6 +19,8 @@ from .. import resources
             nonsensemy guy a whoswho veritably""",
             True,
         ),
+        ("Ça va? «Oui», c'est ça.", "Ça va Oui cest ça", True),
+        ("Ça va? «Oui», c'est ça.", "Ça va Oui cest ça", False),
         (resources.PUNCT_TEXT, resources.PUNCT_TEXT_RESULT_W_APOSTR, False),
         (resources.PUNCT_TEXT, resources.PUNCT_TEXT_RESULT_WO_APOSTR, True),
     ],
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+import pytest
+from textstat.backend import utils
+
+
+@pytest.mark.parametrize(
+    "lang, word, expected",
+    [
+        ("en_US", "cool", 1),
+        ("en_US", "sunglasses", 3),
+        ("en_US", "readability", 5),
+        ("en_GB", "dog", 1),
+        ("en_US", "xqzt", None),
+        ("es_ES", "hola", None),
+        ("de_DE", "hallo", None),
+    ],
+)
+def test_get_cmudict_syllables(lang: str, word: str, expected: int | None) -> None:
+    assert utils.get_cmudict_syllables(lang).get(word) == expected
@@ -19,3 +19,7 @@ def test_get_lang_easy_words(lang: str, n_words: int) -> None:
             assert len(utils.get_lang_easy_words(lang)) == n_words
     else:
         assert len(utils.get_lang_easy_words(lang)) == n_words
+
+
+def test_get_lang_easy_words_is_frozen() -> None:
+    assert isinstance(utils.get_lang_easy_words("en"), frozenset)
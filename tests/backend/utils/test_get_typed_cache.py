@@ -39,3 +39,14 @@ def test_typed_chache(
 
     assert inner_func.cache_info().misses == 1  # type: ignore
     assert inner_func.cache_info().hits == len(outer_funcs)  # type: ignore
+
+
+@pytest.mark.parametrize("maxsize", [None, 1, utils.constants.CACHE_SIZE])
+def test_typed_cache_maxsize(maxsize: int | None) -> None:
+    @utils.typed_cache(maxsize=maxsize)
+    def double(x: int) -> int:
+        return 2 * x
+
+    assert double(1) == double(1) == 2
+    assert double.cache_info().maxsize == maxsize  # type: ignore
+    assert double.cache_info().hits == 1  # type: ignore
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import pytest
+from textstat import textstat
+from ..backend import resources
+
+
+def test_batch_compute() -> None:
+    ts = type(textstat)()
+    ts.set_rounding_points(2)
+    texts = [
+        resources.EMPTY_STR,
+        resources.SHORT_TEXT,
+        resources.PUNCT_TEXT,
+        resources.LONG_TEXT,
+    ]
+    names = ["flesch_reading_ease", "lexicon_count", "text_standard"]
+    assert ts.batch_compute(texts, names) == [
+        {name: getattr(ts, name)(text) for name in names} for text in texts
+    ]
+
+
+@pytest.mark.parametrize("name", ["_legacy_round", "set_lang", "not_a_metric"])
+def test_batch_compute_unknown_name(name: str) -> None:
+    with pytest.raises(ValueError):
+        textstat.batch_compute([resources.SHORT_TEXT], [name])
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import pytest
+from textstat import textstat
+from ..backend import resources
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        resources.EMPTY_STR,
+        resources.SHORT_TEXT,
+        resources.PUNCT_TEXT,
+        resources.LONG_TEXT,
+    ],
+)
+def test_compute_all_averages(text: str) -> None:
+    ts = type(textstat)()
+    ts.set_rounding_points(2)
+    averages = ts.compute_all_averages(text)
+    assert averages == {
+        name: getattr(ts, name)(text)
+        for name in [
+            "avg_syllables_per_word",
+            "avg_character_per_word",
+            "avg_letter_per_word",
+            "avg_sentence_per_word",
+            "words_per_sentence",
+        ]
+    }
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import sys
+import warnings
+from typing import Callable
+
+from textstat import textstat
+import pytest
+
+
+@pytest.mark.parametrize(
+    "call",
+    [
+        lambda: textstat.letter_count("Cool dogs", ignore_spaces=True),
+        lambda: textstat.syllable_count("Cool dogs", lang="en_US"),
+        lambda: textstat.avg_sentence_length("Cool dogs wear da sunglasses."),
+        lambda: type(textstat)().set_rounding(True, 2),
+        lambda: textstat._legacy_round(1.234, 2),
+    ],
+)
+def test_warn_once(call: Callable[[], object], monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(sys.modules["textstat.textstat"], "_WARN_FLAGS", set())
+
+    with pytest.warns(DeprecationWarning):
+        call()
+
+    # the same deprecation is only reported once
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        call()
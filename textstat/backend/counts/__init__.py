@@ -12,6 +12,8 @@ from ._count_monosyllable_words import count_monosyllable_words
 from ._count_polysyllable_words import count_polysyllable_words
 from ._count_sentences import count_sentences
 from ._count_syllables import count_syllables
+from ._count_word_syllables import count_word_syllables
+from ._text_stats import TextStats, text_stats
 
 __all__ = [
     "count_chars",
@@ -28,4 +30,7 @@ __all__ = [
     "count_polysyllable_words",
     "count_sentences",
     "count_syllables",
+    "count_word_syllables",
+    "TextStats",
+    "text_stats",
 ]
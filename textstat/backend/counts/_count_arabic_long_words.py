@@ -1,9 +1,7 @@
 from __future__ import annotations
 
-import re
-
-
 from ..utils._typed_cache import typed_cache
+from ..utils.constants import TASHKEEL_RE
 from ..selections._list_words import list_words
 
 
@@ -25,16 +23,6 @@ def count_arabic_long_words(text: str, rm_apostrophe: bool = True) -> int:
         Number of long arabic words without short vowels (tashkeel).
 
     """
-    tashkeel = (
-        r"\u064E|\u064B|\u064F|\u064C|\u0650|\u064D|\u0651|"
-        + r"\u0652|\u0653|\u0657|\u0658"
-    )
     # remove tashkeel
-    text = re.sub(tashkeel, "", text)
-
-    count = 0
-    for t in list_words(text, rm_apostrophe=rm_apostrophe):
-        if len(t) > 5:
-            count += 1
-
-    return count
+    text = TASHKEEL_RE.sub("", text)
+    return sum(1 for w in list_words(text, rm_apostrophe=rm_apostrophe) if len(w) > 5)
@@ -1,10 +1,16 @@
 from __future__ import annotations
 
-import re
-
 from ..utils._typed_cache import typed_cache
+from ..utils.constants import (
+    ARABIC_LONG_SYLLABLE_RE,
+    ARABIC_STRESS_RE,
+    ARABIC_STRIP_RE,
+)
 from ..selections._list_words import list_words
 
+# tashkeel: fatha | damma | kasra
+_TASHKEEL = "\u064E\u064F\u0650"
+
 
 @typed_cache
 def count_arabic_syllables(text: str, rm_apostrophe: bool = True) -> int:
@@ -25,37 +31,17 @@ def count_arabic_syllables(text: str, rm_apostrophe: bool = True) -> int:
         Number of arabic syllables.
 
     """
-    short_count = 0
-    long_count = 0
-
-    # tashkeel: fatha | damma | kasra
-    tashkeel = [r"\u064E", r"\u064F", r"\u0650"]
-    char_list = [c for w in list_words(text, rm_apostrophe=rm_apostrophe) for c in w]
-
-    for t in tashkeel:
-        for i, c in enumerate(char_list):
-            if c != t:
-                continue
-
-            # only if a character is a tashkeel, has a successor
-            # and is followed by an alef, waw or yaaA ...
-            if i + 1 < len(char_list) and char_list[i + 1] in [
-                "\u0627",
-                "\u0648",
-                "\u064a",
-            ]:
-                # ... increment long syllable count
-                long_count += 1
-            else:
-                short_count += 1
-
-    # stress syllables: tanween fatih | tanween damm | tanween kasr
-    # | shadda
-    stress_pattern = re.compile(r"[\u064B\u064C\u064D\u0651]")
-    stress_count = len(stress_pattern.findall(text))
+    chars = "".join(list_words(text, rm_apostrophe=rm_apostrophe))
+
+    # a tashkeel followed by an alef, waw or yaaA is a long syllable, any other
+    # tashkeel is a short one
+    long_count = len(ARABIC_LONG_SYLLABLE_RE.findall(chars))
+    short_count = sum(chars.count(c) for c in _TASHKEEL) - long_count
+
+    stress_count = len(ARABIC_STRESS_RE.findall(text))
 
     if short_count == 0:
-        text = re.sub(r"[\u0627\u0649\?\.\!\,\s*]", "", text)
+        text = ARABIC_STRIP_RE.sub("", text)
         short_count = len(text) - 2
 
     return short_count + 2 * (long_count + stress_count)
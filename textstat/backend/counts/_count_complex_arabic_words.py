@@ -1,8 +1,7 @@
 from __future__ import annotations
 
-import re
-
 from ..utils._typed_cache import typed_cache
+from ..utils.constants import HARAKAT_RE
 from ..selections._list_words import list_words
 
 
@@ -34,12 +33,8 @@ def count_complex_arabic_words(text: str, rm_apostrophe: bool = True) -> int:
     """
     count = 0
 
-    # fatHa | tanween fatH | dhamma | tanween dhamm
-    # | kasra | tanween kasr | shaddah
-    pattern = re.compile("[\u064e\u064b\u064f\u064c\u0650\u064d\u0651]")
-
     for w in list_words(text, rm_apostrophe=rm_apostrophe):
-        if len(pattern.findall(w)) > 5:
+        if len(HARAKAT_RE.findall(w)) > 5:
             count += 1
 
     return count
@@ -1,8 +1,7 @@
 from __future__ import annotations
 
-import re
-
 from ..utils._typed_cache import typed_cache
+from ..utils.constants import BI_FASEEH_RE, UNI_FASEEH_RE
 from ._count_arabic_syllables import count_arabic_syllables
 from ..selections._list_words import list_words
 
@@ -26,17 +25,10 @@ def count_faseeh(text: str, rm_apostrophe: bool = True) -> int:
     """
     count = 0
 
-    # single faseeh char's: hamza nabira | hamza satr | amza waw | Thal
-    # | DHaA
-    unipattern = re.compile(r"[\u0626\u0621\u0624\u0630\u0638]")
-
-    # double faseeh char's: waw wa alef | waw wa noon
-    bipattern = re.compile(r"(\u0648\u0627|\u0648\u0646)")
-
     for w in list_words(text, rm_apostrophe=rm_apostrophe):
-        faseeh_count = len(unipattern.findall(w)) + len(bipattern.findall(w))
+        has_faseeh = UNI_FASEEH_RE.search(w) or BI_FASEEH_RE.search(w)
 
-        if count_arabic_syllables(w) > 5 and faseeh_count > 0:
+        if has_faseeh and count_arabic_syllables(w) > 5:
             count += 1
 
     return count
@@ -1,10 +1,21 @@
 from __future__ import annotations
 
-import re
-
 from ..utils._typed_cache import typed_cache
+from ..utils.constants import PUNCTUATION_RE, WHITESPACE_RE
 from ..transformations._remove_punctuation import remove_punctuation
 
+# Deletion table for the whitespace and punctuation in ASCII text, so letters
+# can be counted with a single str.translate.
+_ASCII_NON_LETTERS = str.maketrans(
+    "",
+    "",
+    "".join(
+        c
+        for c in map(chr, range(128))
+        if WHITESPACE_RE.match(c) or PUNCTUATION_RE.match(c)
+    ),
+)
+
 
 @typed_cache
 def count_letters(text: str) -> int:
@@ -21,6 +32,9 @@ def count_letters(text: str) -> int:
         The number of letters in text.
 
     """
+    if text.isascii():
+        return len(text.translate(_ASCII_NON_LETTERS))
+
     # Ignore spaces
-    text = re.sub(r"\s", "", text)
+    text = "".join(text.split())
     return len(remove_punctuation(text, rm_apostrophe=True))
@@ -1,8 +1,7 @@
 from __future__ import annotations
 
 from ..utils._typed_cache import typed_cache
-from ._count_syllables import count_syllables
-from ..selections._list_words import list_words
+from ._text_stats import text_stats
 
 
 @typed_cache
@@ -21,4 +20,4 @@ def count_monosyllable_words(text: str, lang: str) -> int:
     int
     Number of monosyllable words in the text.
     """
-    return len([w for w in list_words(text) if count_syllables(w, lang) == 1])
+    return text_stats(text, lang).n_monosyllable_words
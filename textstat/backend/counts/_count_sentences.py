@@ -1,9 +1,7 @@
 from __future__ import annotations
 
-import re
-
 from ..utils._typed_cache import typed_cache
-from ._count_words import count_words
+from ..utils.constants import SENTENCE_RE, SENTENCE_MIN_WORDS_RE
 
 
 @typed_cache
@@ -24,9 +22,8 @@ def count_sentences(text: str) -> int:
     if len(text) == 0:
         return 0
 
-    ignore_count = 0
-    sentences = re.findall(r"\b[^.!?]+[.!?]*", text, re.UNICODE)
-    for sentence in sentences:
-        if count_words(sentence) <= 2:
-            ignore_count += 1
-    return max(1, len(sentences) - ignore_count)
+    # sentences of two words or less are ignored
+    n_sentences = sum(
+        1 for s in SENTENCE_RE.finditer(text) if SENTENCE_MIN_WORDS_RE.search(s.group())
+    )
+    return max(1, n_sentences)
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from ..selections._list_words import list_words
+from ..utils._get_cmudict_syllables import get_cmudict_syllables
+from ..utils._get_pyphen import get_pyphen
+from ..utils._typed_cache import typed_cache
+from ..utils.constants import WORD_CACHE_SIZE
+
+
+@typed_cache(maxsize=WORD_CACHE_SIZE)
+def _count_pyphen_syllables(word: str, lang: str) -> int:
+    """Estimate the number of syllables of a word with pyphen.
+
+    Parameters
+    ----------
+    word : str
+        A lowercase word.
+    lang : str
+        The language of the word.
+
+    Returns
+    -------
+    int
+        Number of syllables in `word`.
+    """
+    return len(get_pyphen(lang).positions(word)) + 1
+
+
+@typed_cache
+def count_word_syllables(text: str, lang: str) -> list[int]:
+    """Estimate the number of syllables of each word in a text.
+
+    Parameters
+    ----------
+    text : str
+        A text string.
+    lang : str
+        The language of the text.
+
+    Returns
+    -------
+    List[int]
+        The number of syllables of each word, in the order of `list_words`.
+    """
+    words = list_words(text, lowercase=True)
+    if not words:
+        return []
+
+    cmu_syllables = get_cmudict_syllables(lang)
+    # fail early for languages that pyphen doesn't support
+    get_pyphen(lang)
+
+    word_syllables = []
+    for word in words:
+        n_syllables = cmu_syllables.get(word)
+        if n_syllables is None:
+            # not in cmudict, fall back to pyphen's hyphenation points
+            n_syllables = _count_pyphen_syllables(word, lang)
+        word_syllables.append(n_syllables)
+
+    return word_syllables
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from typing import NamedTuple
+
+from ..utils._typed_cache import typed_cache
+from ._count_chars import count_chars
+from ._count_letters import count_letters
+from ._count_sentences import count_sentences
+from ._count_word_syllables import count_word_syllables
+
+
+class TextStats(NamedTuple):
+    """Basic counts of a text, as returned by `text_stats`.
+
+    Attributes
+    ----------
+    n_chars : int
+        Number of characters, ignoring whitespace.
+    n_letters : int
+        Number of letters.
+    n_words : int
+        Number of words.
+    n_sentences : int
+        Number of sentences.
+    n_syllables : int
+        Number of syllables.
+    n_polysyllable_words : int
+        Number of words with three or more syllables.
+    n_monosyllable_words : int
+        Number of words with only one syllable.
+
+    """
+
+    n_chars: int
+    n_letters: int
+    n_words: int
+    n_sentences: int
+    n_syllables: int
+    n_polysyllable_words: int
+    n_monosyllable_words: int
+
+
+@typed_cache
+def text_stats(text: str, lang: str) -> TextStats:
+    """Count the basic statistics of a text in one go.
+
+    The syllables of each word are only counted once (see
+    `count_word_syllables`), and the result is shared by the word, syllable,
+    polysyllable and monosyllable counts.
+
+    Parameters
+    ----------
+    text : str
+        A text string.
+    lang : str
+        The language of the text.
+
+    Returns
+    -------
+    TextStats
+        The basic counts of `text`.
+
+    """
+    word_syllables = count_word_syllables(text, lang)
+    n_polysyllable_words = 0
+    n_monosyllable_words = 0
+    for n in word_syllables:
+        if n >= 3:
+            n_polysyllable_words += 1
+        elif n == 1:
+            n_monosyllable_words += 1
+
+    return TextStats(
+        n_chars=count_chars(text, ignore_spaces=True),
+        n_letters=count_letters(text),
+        n_words=len(word_syllables),
+        n_sentences=count_sentences(text),
+        n_syllables=sum(word_syllables),
+        n_polysyllable_words=n_polysyllable_words,
+        n_monosyllable_words=n_monosyllable_words,
+    )
@@ -26,9 +26,7 @@ def chars_per_word(text: str, ignore_spaces: bool = True) -> float:
 
     """
     # We count puntuation-words as words because those characters get counted
-    try:
-        return count_chars(text, ignore_spaces=ignore_spaces) / count_words(
-            text, rm_punctuation=False
-        )
-    except ZeroDivisionError:
+    n_words = count_words(text, rm_punctuation=False)
+    if n_words == 0:
         return 0.0
+    return count_chars(text, ignore_spaces=ignore_spaces) / n_words
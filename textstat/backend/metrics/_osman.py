@@ -24,13 +24,13 @@ def osman(text: str) -> float:
     float
         The Osman index for `text`
     """
-    try:
-        complex_word_rate = count_complex_arabic_words(text) / count_words(text)
-        long_word_rate = count_arabic_long_words(text) / count_words(text)
-        syllables_per_word = count_arabic_syllables(text) / count_words(text)
-        faseeh_per_word = count_faseeh(text) / count_words(text)
-    except ZeroDivisionError:
+    n_words = count_words(text)
+    if n_words == 0:
         return 0.0
+    complex_word_rate = count_complex_arabic_words(text) / n_words
+    long_word_rate = count_arabic_long_words(text) / n_words
+    syllables_per_word = count_arabic_syllables(text) / n_words
+    faseeh_per_word = count_faseeh(text) / n_words
 
     return (
         200.791
@@ -1,8 +1,7 @@
 from __future__ import annotations
 
 from ..utils._typed_cache import typed_cache
-from ..counts._count_sentences import count_sentences
-from ..counts._count_polysyllable_words import count_polysyllable_words
+from ..counts._text_stats import text_stats
 
 
 @typed_cache
@@ -31,10 +30,9 @@ def smog_index(text: str, lang: str) -> float:
 
     Polysyllabic words are defined as words with more than 3 syllables.
     """
-    sentences = count_sentences(text)
-
-    poly_syllab = count_polysyllable_words(text, lang)
+    stats = text_stats(text, lang)
     try:
-        return (1.043 * (30 * (poly_syllab / sentences)) ** 0.5) + 3.1291
+        ratio = stats.n_polysyllable_words / stats.n_sentences
+        return (1.043 * (30 * ratio) ** 0.5) + 3.1291
     except ZeroDivisionError:
         return 0.0
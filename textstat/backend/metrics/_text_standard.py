@@ -1,8 +1,5 @@
 from __future__ import annotations
 
-import math
-from collections import Counter
-
 from ..utils._typed_cache import typed_cache
 from ._flesch_kincaid_grade import flesch_kincaid_grade
 from ._flesch_reading_ease import flesch_reading_ease
@@ -14,6 +11,46 @@ from ._linsear_write_formula import linsear_write_formula
 from ._gunning_fog import gunning_fog
 
 
+# Grades for each band of ten Flesch Reading Ease points, from [0, 10) up to
+# [100, inf). Scores below 30 map to grade 13 and the [60, 70) band counts
+# towards both grade 8 and grade 9.
+_FRE_GRADES = (
+    (13,),
+    (13,),
+    (13,),
+    (12,),
+    (11,),
+    (10,),
+    (8, 9),
+    (7,),
+    (6,),
+    (5,),
+    (5,),
+)
+
+
+def _grade_bounds(score: float) -> tuple[int, int, int]:
+    """Get the floor, ceiling and nearest integer of a grade score.
+
+    Parameters
+    ----------
+    score : float
+        A grade score.
+
+    Returns
+    -------
+    tuple[int, int, int]
+        The floor, ceiling and nearest integer of `score`.
+
+    """
+    # int() truncates towards zero, so negative scores need stepping down
+    lower = int(score)
+    if lower > score:
+        lower -= 1
+    upper = lower if lower == score else lower + 1
+    return lower, upper, round(score)
+
+
 @typed_cache
 def text_standard(text: str, lang: str) -> float:
     """Calculate the Text Standard for `text`. This function specifically calculates
@@ -31,78 +68,42 @@ def text_standard(text: str, lang: str) -> float:
     float
         The Text Standard for `text`.
     """
+    # there is nothing to grade in a blank text, so skip all of the metrics
+    if not text.strip():
+        return 0.0
+
     grade: list[int] = []
 
     # Appending Flesch Kincaid Grade
-    score = flesch_kincaid_grade(text, lang)
-    lower = math.floor(score)
-    upper = math.ceil(score)
-    near = round(score)
-    grade.extend([lower, upper, near])
+    grade.extend(_grade_bounds(flesch_kincaid_grade(text, lang)))
 
     # Appending Flesch Reading Ease
     score = flesch_reading_ease(text, lang)
-    if score < 100 and score >= 90:
-        grade.append(5)
-    elif score < 90 and score >= 80:
-        grade.append(6)
-    elif score < 80 and score >= 70:
-        grade.append(7)
-    elif score < 70 and score >= 60:
-        grade.append(8)
-        grade.append(9)
-    elif score < 60 and score >= 50:
-        grade.append(10)
-    elif score < 50 and score >= 40:
-        grade.append(11)
-    elif score < 40 and score >= 30:
-        grade.append(12)
-    else:
-        grade.append(13)
+    grade.extend(_FRE_GRADES[max(0, min(10, int(score) // 10))])
 
     # Appending SMOG Index
-    score = smog_index(text, lang)
-    lower = math.floor(score)
-    upper = math.ceil(score)
-    near = round(score)
-    grade.extend([lower, upper, near])
+    grade.extend(_grade_bounds(smog_index(text, lang)))
 
     # Appending Coleman_Liau_Index
-    score = coleman_liau_index(text)
-    lower = math.floor(score)
-    upper = math.ceil(score)
-    near = round(score)
-    grade.extend([lower, upper, near])
+    grade.extend(_grade_bounds(coleman_liau_index(text)))
 
     # Appending Automated_Readability_Index
-    score = automated_readability_index(text)
-    lower = math.floor(score)
-    upper = math.ceil(score)
-    near = round(score)
-    grade.extend([lower, upper, near])
+    grade.extend(_grade_bounds(automated_readability_index(text)))
 
     # Appending Dale_Chall_Readability_Score
-    score = dale_chall_readability_score(text, lang)
-    lower = math.floor(score)
-    upper = math.ceil(score)
-    near = round(score)
-    grade.extend([lower, upper, near])
+    grade.extend(_grade_bounds(dale_chall_readability_score(text, lang)))
 
     # Appending Linsear_Write_Formula
     score = linsear_write_formula(text, lang, strict_lower=False, strict_upper=True)
-    lower = math.floor(score)
-    upper = math.ceil(score)
-    near = round(score)
-    grade.extend([lower, upper, near])
+    grade.extend(_grade_bounds(score))
 
     # Appending Gunning Fog Index
-    score = gunning_fog(text, lang)
-    lower = math.floor(score)
-    upper = math.ceil(score)
-    near = round(score)
-    grade.extend([lower, upper, near])
-
-    # Finding the Readability Consensus based upon all the above tests
-    d = Counter(grade)
-    final_grade = d.most_common(1)
-    return float(final_grade[0][0])
+    grade.extend(_grade_bounds(gunning_fog(text, lang)))
+
+    # Finding the Readability Consensus based upon all the above tests.
+    # Grades can be negative or arbitrarily large, so they are tallied in a dict
+    # rather than a fixed-size array. Ties go to the grade seen first.
+    tally: dict[int, int] = {}
+    for g in grade:
+        tally[g] = tally.get(g, 0) + 1
+    return float(max(tally, key=tally.__getitem__))
@@ -23,7 +23,7 @@ def words_per_sentence(text: str) -> float:
         The average number of words per sentence.
 
     """
-    try:
-        return count_words(text) / count_sentences(text)
-    except ZeroDivisionError:
+    n_sentences = count_sentences(text)
+    if n_sentences == 0:
         return 0.0
+    return count_words(text) / n_sentences
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 
 from ..validations._is_difficult_word import is_difficult_word
+from ..utils._get_lang_easy_words import get_lang_easy_words
 from ..utils._typed_cache import typed_cache
 from ._list_words import list_words
 
@@ -27,7 +28,11 @@ def list_difficult_words(text: str, syllable_threshold: int, lang: str) -> list[
 
     """
     words = list_words(text)
-    diff_words = [
-        word for word in words if is_difficult_word(word, syllable_threshold, lang)
-    ]
-    return diff_words
+    easy_word_set = get_lang_easy_words(lang)
+    # check each distinct word once, skipping easy words before the syllable count
+    is_difficult = {
+        word: is_difficult_word(word, syllable_threshold, lang)
+        for word in set(words)
+        if word.lower() not in easy_word_set
+    }
+    return [word for word in words if is_difficult.get(word, False)]
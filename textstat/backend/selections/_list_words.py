@@ -1,10 +1,8 @@
 from __future__ import annotations
-import re
-
 
 from ..transformations._remove_punctuation import remove_punctuation
 from ..utils._typed_cache import typed_cache
-from ..utils.constants import RE_CONTRACTION_APOSTROPHE
+from ..utils.constants import CONTRACTION_APOSTROPHE_RE
 
 
 @typed_cache
@@ -46,11 +44,11 @@ def list_words(
 
     """
     if split_hyphens:
-        text = re.sub(r"-", " ", text)
+        text = text.replace("-", " ")
     if rm_punctuation:
         text = remove_punctuation(text, rm_apostrophe=rm_apostrophe)
     if lowercase:
         text = text.lower()
     if split_contractions:
-        text = re.sub(RE_CONTRACTION_APOSTROPHE, " ", text)
+        text = CONTRACTION_APOSTROPHE_RE.sub(" ", text)
     return text.split()
@@ -1,9 +1,25 @@
 from __future__ import annotations
 
-import re
-
 from ..utils._typed_cache import typed_cache
-from ..utils.constants import RE_NONCONTRACTION_APOSTROPHE
+from ..utils.constants import (
+    NONCONTRACTION_APOSTROPHE_RE,
+    PUNCTUATION_RE,
+    PUNCTUATION_WO_APOSTROPHE_RE,
+)
+
+# Deletion tables matching the punctuation patterns on ASCII text, where
+# str.translate is much faster than a regex substitution. Derived from the
+# patterns themselves so both paths always agree.
+_ASCII_PUNCTUATION = str.maketrans(
+    "", "", "".join(chr(i) for i in range(128) if PUNCTUATION_RE.match(chr(i)))
+)
+_ASCII_PUNCTUATION_WO_APOSTROPHE = str.maketrans(
+    "",
+    "",
+    "".join(
+        chr(i) for i in range(128) if PUNCTUATION_WO_APOSTROPHE_RE.match(chr(i))
+    ),
+)
 
 
 @typed_cache
@@ -32,12 +48,13 @@ def remove_punctuation(
     """
     if rm_apostrophe:
         # remove all punctuation
-        punctuation_regex = r"[^\w\s]"
-    else:
-        # remove non-apostrophe single quotation marks
-        text = re.sub(RE_NONCONTRACTION_APOSTROPHE, "", text)
-        # remove all punctuation except apostrophes
-        punctuation_regex = r"[^\w\s\']"
-
-    text = re.sub(punctuation_regex, "", text)
-    return text
+        if text.isascii():
+            return text.translate(_ASCII_PUNCTUATION)
+        return PUNCTUATION_RE.sub("", text)
+
+    # remove non-apostrophe single quotation marks
+    text = NONCONTRACTION_APOSTROPHE_RE.sub("", text)
+    # remove all punctuation except apostrophes
+    if text.isascii():
+        return text.translate(_ASCII_PUNCTUATION_WO_APOSTROPHE)
+    return PUNCTUATION_WO_APOSTROPHE_RE.sub("", text)
@@ -1,4 +1,5 @@
 from ._get_cmudict import get_cmudict
+from ._get_cmudict_syllables import get_cmudict_syllables
 from ._get_grade_suffix import get_grade_suffix
 from ._get_lang_cfg import get_lang_cfg
 from ._get_lang_easy_words import get_lang_easy_words
@@ -9,6 +10,7 @@ from . import constants
 
 __all__ = [
     "get_cmudict",
+    "get_cmudict_syllables",
     "get_grade_suffix",
     "get_lang_cfg",
     "get_lang_easy_words",
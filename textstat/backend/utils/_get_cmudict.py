@@ -1,12 +1,10 @@
 from __future__ import annotations
 
-import cmudict
-
 from ._typed_cache import typed_cache
 from ._get_lang_root import get_lang_root
 
 
-@typed_cache
+@typed_cache(maxsize=None)
 def get_cmudict(lang: str) -> dict[str, list[list[str]]] | None:
     """Get a cmudict object for the given language. Currently only English is supported.
 
@@ -22,6 +20,10 @@ def get_cmudict(lang: str) -> dict[str, list[list[str]]] | None:
         supported).
     """
     if get_lang_root(lang) == "en":
+        # importing cmudict takes most of textstat's import time, so only pay for
+        # it once English syllables are needed
+        import cmudict
+
         return cmudict.dict()
     else:
         return None
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from ._typed_cache import typed_cache
+from ._get_cmudict import get_cmudict
+
+
+@typed_cache(maxsize=None)
+def get_cmudict_syllables(lang: str) -> dict[str, int]:
+    """Get the number of syllables of each word in cmudict for the given language.
+
+    The syllables are the stressed phones (those ending in a digit) of the first
+    pronunciation of each word. Counting them once up front turns the per-word
+    phone scan into a single dict lookup.
+
+    Parameters
+    ----------
+    lang : str
+        The language of the text.
+
+    Returns
+    -------
+    dict[str, int]
+        The number of syllables of each cmudict word (empty if the language is not
+        supported by cmudict).
+    """
+    cmu_dict = get_cmudict(lang)
+    if cmu_dict is None:
+        return {}
+    return {
+        word: len([p for p in prons[0] if p[-1].isdigit()])
+        for word, prons in cmu_dict.items()
+        if prons
+    }
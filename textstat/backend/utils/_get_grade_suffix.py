@@ -1,6 +1,12 @@
 from __future__ import annotations
 
+from ._typed_cache import typed_cache
 
+_ORDINAL_MAP = {1: "st", 2: "nd", 3: "rd"}
+_TEENS_MAP = {11: "th", 12: "th", 13: "th"}
+
+
+@typed_cache
 def get_grade_suffix(grade: int) -> str:
     """Select correct ordinal suffix.
 
@@ -14,9 +20,5 @@ def get_grade_suffix(grade: int) -> str:
     str
         The ordinal suffix.
     """
-    ordinal_map = {1: "st", 2: "nd", 3: "rd"}
-    teens_map = {11: "th", 12: "th", 13: "th"}
-    ordinal_value = grade % 10
-    teen_value = grade % 100
-    ordinal_suffix = ordinal_map.get(ordinal_value, "th")
-    return teens_map.get(teen_value, ordinal_suffix)
+    ordinal_suffix = _ORDINAL_MAP.get(grade % 10, "th")
+    return _TEENS_MAP.get(grade % 100, ordinal_suffix)
@@ -7,29 +7,33 @@ from ._get_lang_root import get_lang_root
 import sys
 
 if sys.version_info < (3, 9):
-    import pkg_resources
 
-    def _set_words(lang_root: str) -> set[str]:
-        return {
+    def _set_words(lang_root: str) -> frozenset[str]:
+        # imported on first use to keep `import textstat` fast
+        import pkg_resources
+
+        return frozenset(
             ln.decode("utf-8").strip()
             for ln in pkg_resources.resource_stream(
                 "textstat",
                 f"resources/{lang_root}/easy_words.txt",
             )
-        }
+        )
 else:
-    import importlib.resources as importlib_resources
 
-    def _set_words(lang_root: str) -> set[str]:
+    def _set_words(lang_root: str) -> frozenset[str]:
+        # imported on first use to keep `import textstat` fast
+        import importlib.resources as importlib_resources
+
         ref = importlib_resources.files("textstat").joinpath(
             f"resources/{lang_root}/easy_words.txt"
         )
         with ref.open() as f:
-            return {ln.strip() for ln in f}
+            return frozenset(ln.strip() for ln in f)
 
 
-@typed_cache
-def get_lang_easy_words(lang: str) -> set[str]:
+@typed_cache(maxsize=None)
+def get_lang_easy_words(lang: str) -> frozenset[str]:
     """Get the easy words for a given language. If the language is not supported,
     the easy words for english are returned.
 
@@ -40,8 +44,8 @@ def get_lang_easy_words(lang: str) -> set[str]:
 
     Returns
     -------
-    set[str]
-        A set of easy words.
+    frozenset[str]
+        A set of easy words. It is shared by all callers, so it can't be modified.
     """
     lang_root = get_lang_root(lang)
     try:
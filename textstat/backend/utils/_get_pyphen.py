@@ -1,11 +1,14 @@
 from __future__ import annotations
 
-from pyphen import Pyphen  # type: ignore
+from typing import TYPE_CHECKING
 
 from ._typed_cache import typed_cache
 
+if TYPE_CHECKING:
+    from pyphen import Pyphen  # type: ignore
 
-@typed_cache
+
+@typed_cache(maxsize=None)
 def get_pyphen(lang: str) -> Pyphen:
     """Get a pyphen object for the given language.
 
@@ -19,4 +22,7 @@ def get_pyphen(lang: str) -> Pyphen:
     Pyphen
         A Pyphen object for the given language.
     """
+    # imported on first use to keep `import textstat` fast
+    from pyphen import Pyphen  # type: ignore
+
     return Pyphen(lang=lang)
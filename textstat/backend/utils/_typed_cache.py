@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from functools import lru_cache
-from typing import Callable, TYPE_CHECKING
+from typing import Callable, overload, TYPE_CHECKING
 
 from .constants import CACHE_SIZE
 
@@ -9,18 +9,37 @@ if TYPE_CHECKING:
     from .constants import T, P
 
 
-def typed_cache(func: Callable[P, T]) -> Callable[P, T]:
+@overload
+def typed_cache(func: Callable[P, T]) -> Callable[P, T]: ...
+
+
+@overload
+def typed_cache(
+    *, maxsize: int | None = CACHE_SIZE
+) -> Callable[[Callable[P, T]], Callable[P, T]]: ...
+
+
+def typed_cache(func=None, *, maxsize=CACHE_SIZE):  # type: ignore
     """Decorator to cache function results without losing type info.
 
+    Can be used bare (`@typed_cache`) or with a cache size
+    (`@typed_cache(maxsize=None)`). A `maxsize` of None gives an unbounded cache
+    without LRU bookkeeping, which should only be used for functions whose
+    arguments take few distinct values (e.g. a language code).
+
     Parameters
     ----------
     func : Callable
         The function to cache.
+    maxsize : int or None, optional
+        The maximum number of cached results. The default is `CACHE_SIZE`.
 
     Returns
     -------
     Callable
-        The cache-wrapped function.
+        The cache-wrapped function (or a decorator if `func` is not given).
 
     """
-    return lru_cache(maxsize=CACHE_SIZE)(func)  # type: ignore
+    if func is None:
+        return lru_cache(maxsize=maxsize)
+    return lru_cache(maxsize=maxsize)(func)
@@ -1,4 +1,5 @@
 from __future__ import annotations
+import re
 import typing
 
 if typing.TYPE_CHECKING:
@@ -68,4 +69,40 @@ RE_CONTRACTION_ENDINGS = r"[tsd]|ve|ll|re"
 RE_CONTRACTION_APOSTROPHE = r"\'(?=" + RE_CONTRACTION_ENDINGS + ")"
 RE_NONCONTRACTION_APOSTROPHE = r"\'(?!" + RE_CONTRACTION_ENDINGS + ")"
 
+# Compiled patterns, shared by the backend modules so each is compiled once.
+CONTRACTION_APOSTROPHE_RE = re.compile(RE_CONTRACTION_APOSTROPHE)
+NONCONTRACTION_APOSTROPHE_RE = re.compile(RE_NONCONTRACTION_APOSTROPHE)
+WHITESPACE_RE = re.compile(r"\s")
+PUNCTUATION_RE = re.compile(r"[^\w\s]")
+PUNCTUATION_WO_APOSTROPHE_RE = re.compile(r"[^\w\s\']")
+SENTENCE_RE = re.compile(r"\b[^.!?]+[.!?]*", re.UNICODE)
+# A whitespace-delimited token is a word (see `count_words`) if it still has a
+# word character after punctuation is removed. Anchoring at the start of a token
+# keeps the scan linear for long runs of punctuation.
+SENTENCE_WORD_RE = re.compile(r"(?<!\S)[^\w\s]*\w")
+# a sentence with at least three such words
+SENTENCE_MIN_WORDS_RE = re.compile(
+    r"{0}(?:.*?{0}){{2}}".format(SENTENCE_WORD_RE.pattern), re.DOTALL
+)
+# tashkeel (short vowels and other diacritics). A compiled character class is
+# used rather than str.translate, which is about ten times slower on Arabic
+# text since non-ASCII strings go through a per-character mapping lookup.
+TASHKEEL_RE = re.compile(
+    r"[\u064E\u064B\u064F\u064C\u0650\u064D\u0651\u0652\u0653\u0657\u0658]"
+)
+# fatHa | tanween fatH | dhamma | tanween dhamm | kasra | tanween kasr | shaddah
+HARAKAT_RE = re.compile("[\u064e\u064b\u064f\u064c\u0650\u064d\u0651]")
+# long syllables: fatha | damma | kasra followed by alef | waw | yaaA
+ARABIC_LONG_SYLLABLE_RE = re.compile(r"[\u064E\u064F\u0650](?=[\u0627\u0648\u064A])")
+# stress syllables: tanween fatih | tanween damm | tanween kasr | shadda
+ARABIC_STRESS_RE = re.compile(r"[\u064B\u064C\u064D\u0651]")
+ARABIC_STRIP_RE = re.compile(r"[\u0627\u0649\?\.\!\,\s*]")
+# single faseeh char's: hamza nabira | hamza satr | amza waw | Thal | DHaA
+UNI_FASEEH_RE = re.compile(r"[\u0626\u0621\u0624\u0630\u0638]")
+# double faseeh char's: waw wa alef | waw wa noon
+BI_FASEEH_RE = re.compile(r"\u0648[\u0627\u0646]")
+
 CACHE_SIZE = 128
+# Word-level results repeat across texts (word frequencies are very skewed), so
+# their caches are much larger than the per-text ones.
+WORD_CACHE_SIZE = 65536
@@ -1,9 +1,44 @@
 from __future__ import annotations
 
 import warnings
+from functools import partial
+from typing import Callable, Iterable
 
 from .backend import transformations, validations, selections, counts, metrics, utils
 
+# keys of the deprecation warnings that have already been emitted
+_WARN_FLAGS: set[str] = set()
+
+
+def _warn_once(key: str, message: str) -> None:
+    """Emit a DeprecationWarning the first time it is triggered.
+
+    Later calls with the same `key` return straight away, so deprecated
+    arguments used in a loop don't pay for `warnings.warn` on every call.
+
+    Parameters
+    ----------
+    key : str
+        A unique name for the warning.
+    message : str
+        The warning message.
+
+    Returns
+    -------
+    None
+
+    """
+    if key in _WARN_FLAGS:
+        return
+    _WARN_FLAGS.add(key)
+    # point at the code calling the deprecated method
+    warnings.warn(message, DeprecationWarning, stacklevel=3)
+
+
+def _no_round(number: float) -> float:
+    """Return `number` unchanged, used when rounding is disabled."""
+    return number
+
 
 class textstatistics:
     """Main textstat class with methods to calculate readability indices.
@@ -32,6 +67,9 @@ class textstatistics:
         contractions along with other punctuation. If False, punctuation is
         removed with the exception of apostrophes in common English contractions.
         Default: True
+    _round_fn : Callable[[float], float]
+        The function applied to all float outputs, chosen by `set_rounding_points`
+        so the rounding setting isn't checked on every call.
     """
 
     __lang = "en_US"
@@ -41,8 +79,11 @@ class textstatistics:
     __rm_apostrophe = True
     text_encoding = "utf-8"
 
+    _round_fn: Callable[[float], float]
+
     def __init__(self):
         self.set_lang(self.__lang)
+        self.set_rounding_points(self.__round_points)
 
     def _cache_clear(self) -> None:
         """Clear the cache.
@@ -82,14 +123,12 @@ class textstatistics:
 
         """
         if points is not None:
-            warnings.warn(
+            _warn_once(
+                "legacy_round_points",
                 "The points argument is deprecated and has no effect. Use "
                 "set_rounding_points instead.",
-                DeprecationWarning,
             )
-        if self.__round_points is None:
-            return number
-        return round(number, self.__round_points)
+        return self._round_fn(number)
 
     def set_rounding_points(self, points: int | None) -> None:
         """Set the number of decimal digits for rounding textstat outputs.
@@ -107,6 +146,10 @@ class textstatistics:
 
         """
         self.__round_points = points
+        if points is None:
+            self._round_fn = _no_round
+        else:
+            self._round_fn = partial(round, ndigits=points)
 
     def set_rounding(self, rounding: bool, points: int | None = None) -> None:
         """Set the rounding behavior. Setting `rounding` to True will round all
@@ -130,14 +173,11 @@ class textstatistics:
             Use set_rounding_points instead
 
         """
-        warnings.warn(
+        _warn_once(
+            "set_rounding",
             "set_rounding is deprecated, use set_rounding_points instead",
-            DeprecationWarning,
         )
-        if rounding:
-            self.__round_points = points
-        else:
-            self.__round_points = None
+        self.set_rounding_points(points if rounding else None)
 
     def set_rm_apostrophe(self, rm_apostrophe: bool) -> None:
         """Sets whether other methods should remove apostrophes in common
@@ -212,10 +252,10 @@ class textstatistics:
 
         """
         if ignore_spaces is not None:
-            warnings.warn(
+            _warn_once(
+                "letter_count_ignore_spaces",
                 "The 'ignore_spaces' argument has been deprecated due "
                 "to having no effect. This argument will be removed in the future.",
-                DeprecationWarning,
             )
         return counts.count_letters(text)
 
@@ -312,11 +352,11 @@ class textstatistics:
             Number of syllables in `text`.
         """
         if lang:
-            warnings.warn(
+            _warn_once(
+                "syllable_count_lang",
                 "The 'lang' argument has been moved to "
                 "'textstat.set_lang(<lang>)'. This argument will be removed "
                 "in the future.",
-                DeprecationWarning,
             )
 
         return counts.count_syllables(text, self.__lang)
@@ -354,13 +394,13 @@ class textstatistics:
             Use `words_per_sentence` instead.
 
         """
-        warnings.warn(
+        _warn_once(
+            "avg_sentence_length",
             "The 'avg_sentence_length' method has been deprecated due to being "
             "the same as 'words_per_sentence'. This method will be removed in the"
             "future.",
-            DeprecationWarning,
         )
-        return self._legacy_round(metrics.words_per_sentence(text))
+        return self._round_fn(metrics.words_per_sentence(text))
 
     def avg_syllables_per_word(self, text: str, interval: int | None = None) -> float:
         """Get the average number of syllables per `interval` words. If
@@ -383,7 +423,7 @@ class textstatistics:
             interval = 1
         aspw = metrics.syllables_per_word(text, self.__lang)
         aspw *= interval
-        return self._legacy_round(aspw)
+        return self._round_fn(aspw)
 
     def avg_character_per_word(self, text: str) -> float:
         """Calculate the average word length in characters.
@@ -399,7 +439,7 @@ class textstatistics:
             The average number of characters per word.
 
         """
-        return self._legacy_round(metrics.chars_per_word(text))
+        return self._round_fn(metrics.chars_per_word(text))
 
     def avg_letter_per_word(self, text: str) -> float:
         """Calculate the average  word length in letters.
@@ -415,7 +455,7 @@ class textstatistics:
             The average number of letters per word.
 
         """
-        return self._legacy_round(metrics.letters_per_word(text))
+        return self._round_fn(metrics.letters_per_word(text))
 
     def avg_sentence_per_word(self, text: str) -> float:
         """Get the number of sentences per word.
@@ -431,7 +471,7 @@ class textstatistics:
             Number of sentences per word.
 
         """
-        return self._legacy_round(metrics.sentences_per_word(text))
+        return self._round_fn(metrics.sentences_per_word(text))
 
     def words_per_sentence(self, text: str) -> float:
         """Calculate the average number of words per sentence.
@@ -447,7 +487,69 @@ class textstatistics:
             The average number of words per sentence.
 
         """
-        return self._legacy_round(metrics.words_per_sentence(text))
+        return self._round_fn(metrics.words_per_sentence(text))
+
+    def compute_all_averages(self, text: str) -> dict[str, float]:
+        """Calculate all of the per-word and per-sentence averages of a text.
+
+        The averages share their underlying counts, so the text is only tokenized
+        once however many of them are needed.
+
+        Parameters
+        ----------
+        text : str
+            A text string.
+
+        Returns
+        -------
+        dict[str, float]
+            The averages, keyed by the name of the method that calculates each one.
+
+        """
+        return {
+            "avg_syllables_per_word": self.avg_syllables_per_word(text),
+            "avg_character_per_word": self.avg_character_per_word(text),
+            "avg_letter_per_word": self.avg_letter_per_word(text),
+            "avg_sentence_per_word": self.avg_sentence_per_word(text),
+            "words_per_sentence": self.words_per_sentence(text),
+        }
+
+    def batch_compute(
+        self, texts: Iterable[str], names: Iterable[str]
+    ) -> list[dict[str, float | str]]:
+        """Calculate several statistics for each text of a corpus.
+
+        The methods are looked up once, and the statistics of a text share their
+        underlying counts, so each text is only tokenized once.
+
+        Parameters
+        ----------
+        texts : Iterable[str]
+            The text strings.
+        names : Iterable[str]
+            The names of the textstat methods to call, e.g. "flesch_reading_ease".
+            Each method is called with the text as its only argument.
+
+        Returns
+        -------
+        list[dict[str, float | str]]
+            For each text, the results keyed by method name.
+
+        Raises
+        ------
+        ValueError
+            If a name is not a textstat method.
+
+        """
+        methods = {}
+        for name in names:
+            method = getattr(self, name, None)
+            if name.startswith(("_", "set_")) or not callable(method):
+                raise ValueError(f"{name!r} is not a textstat method")
+            methods[name] = method
+        return [
+            {name: method(text) for name, method in methods.items()} for text in texts
+        ]
 
     def count_complex_arabic_words(self, text: str) -> int:
         """
@@ -530,7 +632,7 @@ class textstatistics:
         float
             The Flesch Reading Ease for `text`.
         """
-        return self._legacy_round(metrics.flesch_reading_ease(text, self.__lang))
+        return self._round_fn(metrics.flesch_reading_ease(text, self.__lang))
 
     def flesch_kincaid_grade(self, text: str) -> float:
         r"""Calculate the Flesh-Kincaid Grade for `text`.
@@ -554,7 +656,7 @@ class textstatistics:
             (.39*avg\ sentence\ length)+(11.8*avg\ syllables\ per\ word)-15.59
 
         """
-        return self._legacy_round(metrics.flesch_kincaid_grade(text, self.__lang))
+        return self._round_fn(metrics.flesch_kincaid_grade(text, self.__lang))
 
     def polysyllabcount(self, text: str) -> int:
         """Count the number of words with three or more syllables.
@@ -600,7 +702,7 @@ class textstatistics:
 
         Polysyllabic words are defined as words with more than 3 syllables.
         """
-        return self._legacy_round(metrics.smog_index(text, self.__lang))
+        return self._round_fn(metrics.smog_index(text, self.__lang))
 
     def coleman_liau_index(self, text: str) -> float:
         r"""Calculate the Coleman-Liaux index.
@@ -624,7 +726,7 @@ class textstatistics:
             (0.058*n\ letters/n\ words)-(0.296*n\ sentences/n\ words)-15.8
 
         """
-        return self._legacy_round(metrics.coleman_liau_index(text))
+        return self._round_fn(metrics.coleman_liau_index(text))
 
     def automated_readability_index(self, text: str) -> float:
         r"""Calculate the Automated Readability Index (ARI).
@@ -648,7 +750,7 @@ class textstatistics:
             (4.71*n\ characters/n\ words)+(0.5*n\ words/n\ sentences)-21.43
 
         """
-        return self._legacy_round(metrics.automated_readability_index(text))
+        return self._round_fn(metrics.automated_readability_index(text))
 
     def linsear_write_formula(
         self, text: str, strict_lower: bool = False, strict_upper: bool = True
@@ -687,7 +789,7 @@ class textstatistics:
         easy words are defined as words with 2 syllables or less.
         difficult words are defined as words with 3 syllables or more.
         r"""
-        return self._legacy_round(
+        return self._round_fn(
             metrics.linsear_write_formula(
                 text, self.__lang, strict_lower=strict_lower, strict_upper=strict_upper
             )
@@ -831,7 +933,7 @@ class textstatistics:
         If the percentage of difficult words is > 5, 3.6365 is added to the
         score.
         """
-        return self._legacy_round(
+        return self._round_fn(
             metrics.dale_chall_readability_score(text, self.__lang)
         )
 
@@ -848,7 +950,7 @@ class textstatistics:
         float
             The Gunning Fog Index for `text`.
         """
-        return self._legacy_round(metrics.gunning_fog(text, self.__lang))
+        return self._round_fn(metrics.gunning_fog(text, self.__lang))
 
     def lix(self, text: str) -> float:
         r"""Calculate the LIX for `text`
@@ -876,7 +978,7 @@ class textstatistics:
         C= Number of long words (More than 6 letters)
 
         """
-        return self._legacy_round(metrics.lix(text))
+        return self._round_fn(metrics.lix(text))
 
     def rix(self, text: str) -> float:
         r"""Calculate the RIX for `text`
@@ -909,7 +1011,7 @@ class textstatistics:
         hyphenated sequences and abbreviations count as single words.
 
         """
-        return self._legacy_round(metrics.rix(text))
+        return self._round_fn(metrics.rix(text))
 
     def spache_readability(self, text: str, float_output: bool = True) -> float | int:
         """Calculate SPACHE readability formula for young readers. If `float_output`
@@ -929,7 +1031,7 @@ class textstatistics:
         """
         readability_score = metrics.spache_readability(text, self.__lang)
         if float_output:
-            return self._legacy_round(readability_score)
+            return self._round_fn(readability_score)
         else:
             # TODO: should this be rounded instead of int-ed?
             return int(readability_score)
@@ -947,7 +1049,7 @@ class textstatistics:
         float
             The New Dale Chall Readability Score for `text`
         """
-        return self._legacy_round(
+        return self._round_fn(
             metrics.dale_chall_readability_score_v2(text, self.__lang)
         )
 
@@ -971,15 +1073,13 @@ class textstatistics:
         """
         standard_value = metrics.text_standard(text, self.__lang)
         if float_output:
-            return self._legacy_round(standard_value)
+            return self._round_fn(standard_value)
         else:
             lower_score = int(standard_value) - 1
             upper_score = lower_score + 1
-            return "{}{} and {}{} grade".format(
-                lower_score,
-                utils.get_grade_suffix(lower_score),
-                upper_score,
-                utils.get_grade_suffix(upper_score),
+            return (
+                f"{lower_score}{utils.get_grade_suffix(lower_score)} and "
+                f"{upper_score}{utils.get_grade_suffix(upper_score)} grade"
             )
 
     def reading_time(self, text: str, ms_per_char: float = 14.69) -> float:
@@ -997,7 +1097,7 @@ class textstatistics:
         float
             The reading time for `text`.
         """
-        return self._legacy_round(metrics.reading_time(text, ms_per_char))
+        return self._round_fn(metrics.reading_time(text, ms_per_char))
 
     # Spanish readability tests
     def fernandez_huerta(self, text: str) -> float:
@@ -1016,7 +1116,7 @@ class textstatistics:
         float
             The Fernandez Huerta readability score for `text`
         """
-        return self._legacy_round(metrics.fernandez_huerta(text, self.__lang))
+        return self._round_fn(metrics.fernandez_huerta(text, self.__lang))
 
     def szigriszt_pazos(self, text: str) -> float:
         """Calculate Szigriszt Pazos readability score (1992)
@@ -1034,7 +1134,7 @@ class textstatistics:
         float
             The Szigriszt Pazos readability score for `text`
         """
-        return self._legacy_round(metrics.szigriszt_pazos(text, self.__lang))
+        return self._round_fn(metrics.szigriszt_pazos(text, self.__lang))
 
     def gutierrez_polini(self, text: str) -> float:
         """Calculate Guttierrez de Polini index
@@ -1050,7 +1150,7 @@ class textstatistics:
         float
             The Gutierrez de Polini index for `text`
         """
-        return self._legacy_round(metrics.gutierrez_polini(text))
+        return self._round_fn(metrics.gutierrez_polini(text))
 
     def crawford(self, text: str) -> float:
         r"""Calculate the Crawford index for the text.
@@ -1078,7 +1178,7 @@ class textstatistics:
             (-0.205*n\ sentences/n\ words)+(0.049*n\ syllables/n\ words)-3.407
 
         """
-        return self._legacy_round(metrics.crawford(text, self.__lang))
+        return self._round_fn(metrics.crawford(text, self.__lang))
 
     def osman(self, text: str) -> float:
         """Calculate Osman index for Arabic texts
@@ -1094,7 +1194,7 @@ class textstatistics:
         float
             The Osman index for `text`
         """
-        return self._legacy_round(metrics.osman(text))
+        return self._round_fn(metrics.osman(text))
 
     def gulpease_index(self, text: str) -> float:
         """Calculate Indice Gulpease Index for Italian texts
@@ -1110,7 +1210,7 @@ class textstatistics:
         float
             The Gulpease Index for `text`
         """
-        return self._legacy_round(metrics.gulpease_index(text))
+        return self._round_fn(metrics.gulpease_index(text))
 
     def long_word_count(self, text: str, threshold: int = 6) -> int:
         """Counts words with more than `threshold` (default 6) letters.
@@ -1161,7 +1261,7 @@ class textstatistics:
         float
             The Wiener Sachtextformel readability score for `text`
         """
-        return self._legacy_round(
+        return self._round_fn(
             metrics.wiener_sachtextformel(text, variant, self.__lang)
         )
 
@@ -1181,7 +1281,7 @@ class textstatistics:
         float
             The McAlpine EFLAW readability score for `text`
         """
-        return self._legacy_round(metrics.mcalpine_eflaw(text))
+        return self._round_fn(metrics.mcalpine_eflaw(text))
 
     def __get_lang_cfg(self, key: str) -> float:
         """Get a value from the configuration for a specific language.
@@ -1213,7 +1313,7 @@ class textstatistics:
         """
         return utils.get_lang_root(self.__lang)
 
-    def __get_lang_easy_words(self) -> set[str]:
+    def __get_lang_easy_words(self) -> frozenset[str]:
         """Get the easy words for a language.
 
         Parameters
@@ -1222,7 +1322,7 @@ class textstatistics:
 
         Returns
         -------
-        set[str]
+        frozenset[str]
             The easy words for the given language.
         """
         return utils.get_lang_easy_words(self.__lang)